@@ -1,6 +1,8 @@
-from fastapi import FastAPI
-from pydantic import BaseModel
-from typing import Any, Dict, List, Optional
+import json
+
+from fastapi import FastAPI, Response
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Callable, Dict, List, Optional
 
 app = FastAPI(
     title="DORA MCP Server",
@@ -14,11 +16,15 @@ app = FastAPI(
 # ---------------------------------------------------
 
 class CapabilityResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     resources: bool
     tools: bool
 
 
 class Resource(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     name: str
     description: str
@@ -26,17 +32,24 @@ class Resource(BaseModel):
 
 
 class Tool(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     description: str
     input_schema: Dict[str, Any]
 
 
 class ToolCallRequest(BaseModel):
+    # Unknown fields from clients are still ignored rather than rejected.
+    model_config = ConfigDict(frozen=True)
+
     tool_name: str
     arguments: Dict[str, Any]
 
 
 class ToolCallResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     result: Any
     error: Optional[str] = None
@@ -79,6 +92,86 @@ TOOLS: List[Tool] = [
 ]
 
 
+# ---------------------------------------------------
+# PRE-SERIALIZED PAYLOADS
+# ---------------------------------------------------
+
+def _json_bytes(content: Any) -> bytes:
+    """
+    Encodes content the same way FastAPI's JSONResponse does.
+    """
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+# The payloads below never change, so they are serialized once at import
+# time instead of on every request.
+_CAPABILITIES_BYTES = _json_bytes(
+    CapabilityResponse(resources=True, tools=True).model_dump()
+)
+_RESOURCES_BYTES = _json_bytes([r.model_dump() for r in RESOURCES])
+_TOOLS_BYTES = _json_bytes([t.model_dump() for t in TOOLS])
+_HEALTH_BYTES = _json_bytes({"status": "ok"})
+
+_RESOURCE_PAYLOADS: Dict[str, bytes] = {
+    "dora.status": _json_bytes({
+        "status": "ok",
+        "version": "0.1.0",
+        "description": "Minimal MCP server is running."
+    }),
+    "dora.config": _json_bytes({
+        "agents_supported": ["doc-analyzer", "diagram-builder"],
+        "environment": "local",
+        "note": "Static config for POC."
+    }),
+}
+_RESOURCE_NOT_FOUND_BYTES = _json_bytes({"error": "resource_not_found"})
+
+
+def _json_response(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
+
+# ---------------------------------------------------
+# TOOL HANDLERS
+# ---------------------------------------------------
+
+# get_status always returns the same payload, so the response is built once.
+_STATUS_RESPONSE = ToolCallResponse(
+    success=True,
+    result={"status": "ok", "message": "DORA MCP server is operational."},
+)
+
+
+def _get_status(arguments: Dict[str, Any]) -> ToolCallResponse:
+    return _STATUS_RESPONSE
+
+
+def _ping_agent(arguments: Dict[str, Any]) -> ToolCallResponse:
+    agent_id = arguments.get("agent_id", "unknown")
+    # Dummy backend logic – later this will be real DORA logic
+    return ToolCallResponse(
+        success=True,
+        result={
+            "agent_id": agent_id,
+            "reachable": True,
+            "latency_ms": 12,
+        },
+    )
+
+
+# Maps tool names to their handlers; keep in sync with TOOLS.
+_TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], ToolCallResponse]] = {
+    "get_status": _get_status,
+    "ping_agent": _ping_agent,
+}
+
+
 # ---------------------------------------------------
 # MCP ENDPOINTS
 # ---------------------------------------------------
@@ -88,7 +181,7 @@ async def get_capabilities():
     """
     Lists the server's capabilities according to the MCP protocol.
     """
-    return CapabilityResponse(resources=True, tools=True)
+    return _json_response(_CAPABILITIES_BYTES)
 
 
 @app.get("/mcp/resources", response_model=List[Resource])
@@ -96,7 +189,7 @@ async def list_resources():
     """
     Lists available resources.
     """
-    return RESOURCES
+    return _json_response(_RESOURCES_BYTES)
 
 
 @app.get("/mcp/resources/{resource_id}")
@@ -104,21 +197,15 @@ async def get_resource(resource_id: str):
     """
     Returns a specific resource.
     """
-    if resource_id == "dora.status":
-        return {
-            "status": "ok",
-            "version": "0.1.0",
-            "description": "Minimal MCP server is running."
-        }
-
-    if resource_id == "dora.config":
-        return {
-            "agents_supported": ["doc-analyzer", "diagram-builder"],
-            "environment": "local",
-            "note": "Static config for POC."
-        }
+    payload = _RESOURCE_PAYLOADS.get(resource_id)
+    if payload is None:
+        return Response(
+            content=_RESOURCE_NOT_FOUND_BYTES,
+            media_type="application/json",
+            status_code=404,
+        )
 
-    return {"error": "resource_not_found"}
+    return _json_response(payload)
 
 
 @app.get("/mcp/tools", response_model=List[Tool])
@@ -126,7 +213,7 @@ async def list_tools():
     """
     Lists available MCP tools.
     """
-    return TOOLS
+    return _json_response(_TOOLS_BYTES)
 
 
 @app.post("/mcp/tool-call", response_model=ToolCallResponse)
@@ -134,29 +221,15 @@ async def call_tool(req: ToolCallRequest):
     """
     Executes a specific tool call.
     """
-    if req.tool_name == "get_status":
-        return ToolCallResponse(
-            success=True,
-            result={"status": "ok", "message": "DORA MCP server is operational."},
-        )
-
-    if req.tool_name == "ping_agent":
-        agent_id = req.arguments.get("agent_id", "unknown")
-        # Dummy backend logic – later this will be real DORA logic
+    handler = _TOOL_HANDLERS.get(req.tool_name)
+    if handler is None:
         return ToolCallResponse(
-            success=True,
-            result={
-                "agent_id": agent_id,
-                "reachable": True,
-                "latency_ms": 12,
-            },
+            success=False,
+            result=None,
+            error=f"Unknown tool: {req.tool_name}"
         )
 
-    return ToolCallResponse(
-        success=False,
-        result=None,
-        error=f"Unknown tool: {req.tool_name}"
-    )
+    return handler(req.arguments)
 
 
 @app.get("/health")
@@ -164,4 +237,4 @@ async def health():
     """
     Simple healthcheck endpoint.
     """
-    return {"status": "ok"}
+    return _json_response(_HEALTH_BYTES)